@@ -11,6 +11,31 @@ from .goods import GoodType
 from .coins import BonusType
 
 
+def _format_goods(goods, width=3, include_camels=True):
+    """
+    Format goods dictionary into string for display.
+
+    Parameters
+    ----------
+    goods : dict[GoodType, int]
+        Mapping from good types to counts.
+    width : int
+        Width per good item.
+    include_camels : bool
+        Whether to include camels in output.
+
+    Returns
+    -------
+    str
+        A formatted string of goods.
+    """
+    return "".join(
+        (g.value.ljust(width)) * goods[g]
+        for g in GoodType
+        if include_camels or g != GoodType.CAMEL
+    )
+
+
 class Bazaar(Game):
     """
     A class representing a turn-based trading game based on the Jaipur mechanics.
@@ -27,6 +52,9 @@ class Bazaar(Game):
         The current game state represented by a Market instance.
     """
 
+    # maximum number of observations whose legal actions are memoized
+    ACTIONS_CACHE_SIZE = 4096
+
     def __init__(self,
                  players: dict[UUID, Trader],
                  state: Market,
@@ -43,6 +71,7 @@ class Bazaar(Game):
         """
         super().__init__(players, state)
         self.max_rounds = max_rounds
+        self._actions_cache = {}
 
     def terminal(self, state: Market) -> bool:
         """
@@ -69,7 +98,7 @@ class Bazaar(Game):
         # Check if 3 or more goods have empty coin stacks
         empty_goods_coin_stacks = sum(
             len(state.coins.goods_coins[good]) == 0
-            for good in GoodType if good != GoodType.CAMEL
+            for good in GoodType if good is not GoodType.CAMEL
         )
         if empty_goods_coin_stacks >= 3:
             return True
@@ -102,15 +131,8 @@ class Bazaar(Game):
         trader_goods = state.player_goods[observer]
         trader_goods_coins = state.player_coins[observer].goods_coins
 
-        trader_bonus_counts = {
-            bonus: len(state.player_coins[observer].bonus_coins[bonus])
-            for bonus in BonusType
-        }
-
-        global_bonus_counts = {
-            bonus: len(state.coins.bonus_coins[bonus])
-            for bonus in BonusType
-        }
+        trader_bonus_counts = state.player_coins[observer].bonus_coins_counts
+        global_bonus_counts = state.coins.bonus_coins_counts
 
         return MarketObservation(
             observer,
@@ -141,14 +163,28 @@ class Bazaar(Game):
         Returns
         -------
         list of TraderAction
-            A list of all legal actions for the given actor.
+            A list of all legal actions for the given actor. The list is
+            the caller's own, but the actions in it are memoized and shared
+            between calls for the same position, so treat them as read-only.
         """
         obs = self.observe(actor, state)
-        return (
-            TradeAction.all_actions(obs) +
-            SellAction.all_actions(obs) +
-            TakeAction.all_actions(obs)
-        )
+
+        # key on a snapshot of the observation's values, not the observation
+        # itself, which refers to the state's live goods and coin stacks
+        key = obs._key()
+        actions = self._actions_cache.get(key)
+        if actions is None:
+            # unpack straight into one tuple rather than concatenating lists
+            actions = (
+                *TradeAction.all_actions(obs),
+                *SellAction.all_actions(obs),
+                *TakeAction.all_actions(obs),
+            )
+            if len(self._actions_cache) >= self.ACTIONS_CACHE_SIZE:
+                self._actions_cache.clear()
+            self._actions_cache[key] = actions
+
+        return list(actions)
 
     def apply_action(self, state: Market, action: TraderAction) -> Market:
         """
@@ -168,6 +204,7 @@ class Bazaar(Game):
         """
         new_state = state.clone()
         actor = action.actor
+        is_sell = action.trader_action_type is TraderActionType.SELL
 
         for good in action.requested_goods.to_list():
             new_state.player_goods[actor].add(good)
@@ -175,12 +212,12 @@ class Bazaar(Game):
 
         for good in action.offered_goods.to_list():
             new_state.player_goods[actor].remove(good)
-            if action.trader_action_type == TraderActionType.SELL:
+            if is_sell:
                 new_state.sold_goods.append(good)
             else:
                 new_state.goods.add(good)
 
-        if action.trader_action_type == TraderActionType.SELL:
+        if is_sell:
             for _ in range(action._count):
                 coin = new_state.coins.pop_goods_coin(action._sell)
                 new_state.player_coins[actor].add_goods_coin(action._sell, coin)
@@ -221,12 +258,7 @@ class Bazaar(Game):
         if not self.terminal(new_state):
             return 0
 
-        total = 0
-        for good in GoodType:
-            total += sum(new_state.player_coins[player].goods_coins[good])
-        for bonus in BonusType:
-            total += sum(new_state.player_coins[player].bonus_coins[bonus])
-        return total
+        return new_state.player_coins[player].calculate_points()
 
     def output(self):
         """
@@ -240,30 +272,6 @@ class Bazaar(Game):
 
         console = Console()
 
-        def format_goods(goods, width=3, include_camels=True):
-            """
-            Format goods dictionary into string for display.
-
-            Parameters
-            ----------
-            goods : dict[GoodType, int]
-                Mapping from good types to counts.
-            width : int
-                Width per good item.
-            include_camels : bool
-                Whether to include camels in output.
-
-            Returns
-            -------
-            str
-                A formatted string of goods.
-            """
-            return "".join(
-                (g.value.ljust(width)) * goods[g]
-                for g in GoodType
-                if include_camels or g != GoodType.CAMEL
-            )
-
         def make_action_panel():
             action_text = Text()
 
@@ -286,12 +294,12 @@ class Bazaar(Game):
 
             # Offered goods
             action_text.append("\nOffered Goods:\n", style="bold")
-            offered_goods = format_goods(action.offered_goods)
+            offered_goods = _format_goods(action.offered_goods)
             action_text.append(offered_goods + "\n")
 
             # Requested goods
             action_text.append("\nRequested Goods:\n", style="bold")
-            requested_goods = format_goods(action.requested_goods)
+            requested_goods = _format_goods(action.requested_goods)
             action_text.append(requested_goods + "\n")
 
             return Panel(
@@ -305,7 +313,7 @@ class Bazaar(Game):
         def make_market_panel():
             text = Text()
             text.append("Current Goods:\n", style="bold")
-            text.append(format_goods(self.state.goods) + "\n")
+            text.append(_format_goods(self.state.goods) + "\n")
             text.append(f"\nRemaining Goods: {len(self.state.reserved_goods)}\n")
 
             text.append("\nCoins:\n", style="bold")
@@ -314,9 +322,10 @@ class Bazaar(Game):
                     coins = self.state.coins.goods_coins.get(good, [])
                     text.append(f"{good.value.ljust(3)}: {coins}\n")
 
+            market_bonus_counts = self.state.coins.bonus_coins_counts
             text.append("\nCount Bonus Coins:\n", style="bold")
             text.append("  ".join(
-                f"{b.value}: {len(self.state.coins.bonus_coins.get(b, []))}"
+                f"{b.value}: {market_bonus_counts[b]}"
                 for b in BonusType
             ))
 
@@ -329,15 +338,15 @@ class Bazaar(Game):
                 return Panel(f"Player {player.name} not found", title="Error", border_style="red")
 
             goods = self.state.player_goods[player]
-            goods_coins = self.state.player_coins[player].goods_coins
-            bonus_coins = self.state.player_coins[player].bonus_coins
+            coins = self.state.player_coins[player]
+            bonus_counts = coins.bonus_coins_counts
 
             body = Text()
-            body.append(f"Goods:\n{format_goods(goods, include_camels=False)}\n")
+            body.append(f"Goods:\n{_format_goods(goods, include_camels=False)}\n")
             body.append(f"Count{GoodType.CAMEL.value}: {goods[GoodType.CAMEL]}\n")
 
-            goods_value = sum(sum(coins) for coins in goods_coins.values())
-            bonus_value = sum(sum(coins) for coins in bonus_coins.values())
+            goods_value = coins.calculate_points(include_bonus_coins=False)
+            bonus_value = coins.calculate_points() - goods_value
 
             if is_terminal:
                 camel_bonus = self.state.camel_bonus if (
@@ -349,7 +358,7 @@ class Bazaar(Game):
                 body.append(f"Value Goods Coins: {goods_value}\n\n")
                 body.append("Count Bonus Coins:\n", style="bold")
                 body.append("  ".join(
-                    f"{b.value}: {len(bonus_coins.get(b, []))}"
+                    f"{b.value}: {bonus_counts[b]}"
                     for b in BonusType
                 ))
 
@@ -1,3 +1,4 @@
+from bisect import insort
 from enum import Enum
 from .goods import GoodType
 
@@ -8,6 +9,11 @@ class BonusType(Enum):
 
 class Coins:
 
+    __slots__ = (
+        '_goods_coins', '_bonus_coins', '_goods_points', '_bonus_points',
+        '_bonus_counts', '_hash', '_hash_dirty', '_repr'
+    )
+
     def __init__(self):
         self._goods_coins = {
             GoodType.CAMEL: [],
@@ -23,26 +29,95 @@ class Coins:
             BonusType.FOUR: [],
             BonusType.FIVE: []
         }
+        # running totals, so scoring does not have to re-sum every stack
+        self._goods_points = 0
+        self._bonus_points = 0
+        self._bonus_counts = {bonus_type: 0 for bonus_type in self._bonus_coins}
+        self._hash = None
+        self._hash_dirty = True
+        self._repr = None
+
+    def __eq__(self, other):
+        if not isinstance(other, Coins):
+            return NotImplemented
+        return self._stacks() == other._stacks()
+
+    def __hash__(self):
+        if self._hash_dirty:
+            self._hash = hash(self._stacks())
+            self._hash_dirty = False
+        return self._hash
+
+    def _stacks(self):
+        # stacks are keyed by type in a fixed order, so the values alone suffice
+        return (
+            tuple(tuple(coins) for coins in self._goods_coins.values()),
+            tuple(tuple(coins) for coins in self._bonus_coins.values()),
+        )
+
+    def __repr__(self):
+        if self._repr is None:
+            goods_coins = ", ".join(
+                f"{good_type.name}={coins}"
+                for good_type, coins in self._goods_coins.items() if coins
+            )
+            bonus_coins = ", ".join(
+                f"{bonus_type.name}={coins}"
+                for bonus_type, coins in self._bonus_coins.items() if coins
+            )
+            self._repr = f"Coins(goods=[{goods_coins}], bonus=[{bonus_coins}])"
+        return self._repr
+
+    def clone(self) -> 'Coins':
+        coins = Coins.__new__(Coins)
+        coins._goods_coins = {gt: list(c) for gt, c in self._goods_coins.items()}
+        coins._bonus_coins = {bt: list(c) for bt, c in self._bonus_coins.items()}
+        coins._goods_points = self._goods_points
+        coins._bonus_points = self._bonus_points
+        coins._bonus_counts = self._bonus_counts.copy()
+        coins._hash = self._hash
+        coins._hash_dirty = self._hash_dirty
+        coins._repr = self._repr
+        return coins
 
     def add_goods_coin(self, good_type: GoodType, value: int):
         if value:
-            self._goods_coins[good_type].append(value)
-            self._goods_coins[good_type].sort()
+            insort(self._goods_coins[good_type], value)
+            self._goods_points += value
+            self._hash_dirty = True
+            self._repr = None
 
     def pop_goods_coin(self, good_type: GoodType):
         if self._goods_coins[good_type]:
-            return self._goods_coins[good_type].pop()
+            value = self._goods_coins[good_type].pop()
+            self._goods_points -= value
+            self._hash_dirty = True
+            self._repr = None
+            return value
         return None
 
     def add_bonus_coin(self, bonus_type: BonusType, value: int):
         if value:
-            self._bonus_coins[bonus_type].append(value)
-            self._bonus_coins[bonus_type].sort()
+            insort(self._bonus_coins[bonus_type], value)
+            self._bonus_points += value
+            self._bonus_counts[bonus_type] += 1
+            self._hash_dirty = True
+            self._repr = None
 
     def pop_bonus_coin(self, bonus_type: BonusType):
         if self._bonus_coins[bonus_type]:
-            return self._bonus_coins[bonus_type].pop()
+            value = self._bonus_coins[bonus_type].pop()
+            self._bonus_points -= value
+            self._bonus_counts[bonus_type] -= 1
+            self._hash_dirty = True
+            self._repr = None
+            return value
         return None
+
+    def calculate_points(self, include_bonus_coins=True):
+        if include_bonus_coins:
+            return self._goods_points + self._bonus_points
+        return self._goods_points
     
     @property
     def goods_coins(self):
@@ -50,4 +125,8 @@ class Coins:
     
     @property
     def bonus_coins(self):
-        return self._bonus_coins
\ No newline at end of file
+        return self._bonus_coins
+
+    @property
+    def bonus_coins_counts(self):
+        return self._bonus_counts.copy()
\ No newline at end of file
@@ -12,6 +12,8 @@ class GoodType(Enum):
 
 class Goods:
 
+    __slots__ = ('_goods', '_total', '_non_camel', '_hash', '_hash_dirty', '_repr')
+
     def __init__(self):
 
         self._goods = {
@@ -23,32 +25,76 @@ class Goods:
             GoodType.GOLD: 0,
             GoodType.DIAMOND: 0
         }
+        self._total = 0
+        self._non_camel = 0
+
+        self._hash = None
+        self._hash_dirty = True
+        self._repr = None
+
+    def __eq__(self, other):
+        if not isinstance(other, Goods):
+            return NotImplemented
+        return self._counts() == other._counts()
+
+    def __hash__(self):
+        if self._hash_dirty:
+            self._hash = hash(self._counts())
+            self._hash_dirty = False
+        return self._hash
+
+    def _counts(self):
+        # every Goods holds the same keys in the same order, so the counts
+        # alone identify it; this also avoids Enum.__hash__, which is Python-level
+        return tuple(self._goods.values())
+
+    def __repr__(self):
+        if self._repr is None:
+            self._repr = "Goods(" + ", ".join(
+                f"{good_type.name}={count}"
+                for good_type, count in self._goods.items() if count
+            ) + ")"
+        return self._repr
     
+    def clone(self) -> 'Goods':
+        goods = Goods.__new__(Goods)
+        goods._goods = self._goods.copy()
+        goods._total = self._total
+        goods._non_camel = self._non_camel
+        goods._hash = self._hash
+        goods._hash_dirty = self._hash_dirty
+        goods._repr = self._repr
+        return goods
+
     def __getitem__(self, gt: GoodType):
         return self._goods[gt]
     
     def add(self, good_type):
         self._goods[good_type] += 1
+        self._total += 1
+        if good_type is not GoodType.CAMEL:
+            self._non_camel += 1
+        self._hash_dirty = True
+        self._repr = None
 
     def remove(self, good_type):
         if self._goods[good_type] > 0:
             self._goods[good_type] -= 1
+            self._total -= 1
+            if good_type is not GoodType.CAMEL:
+                self._non_camel -= 1
+            self._hash_dirty = True
+            self._repr = None
 
     def count(self, include_camels=True):
-        cnt = 0
-        for good_type in GoodType:
-            cnt += self._goods.get(good_type, 0)
-        
-        if not include_camels:
-            cnt -= self._goods.get(GoodType.CAMEL, 0)
-
-        return cnt
+        if include_camels:
+            return self._total
+        return self._non_camel
     
     def to_list(self) -> list[GoodType]:
         lst = []
         for good_type in GoodType:
-            for _ in range(self._goods[good_type]):
-                lst.append(good_type)
+            lst += [good_type] * self._goods[good_type]
         return lst
 
     @staticmethod
@@ -61,6 +107,10 @@ class Goods:
     @staticmethod
     def from_dict(dct: dict[GoodType, int]) -> 'Goods':
         goods = Goods()
-        for good_type in GoodType:
-            goods._goods[good_type] = dct.get(good_type, 0)
+        counts = goods._goods
+        for good_type in counts:
+            counts[good_type] = dct.get(good_type, 0)
+        goods._total = sum(goods._goods.values())
+        goods._non_camel = goods._total - goods._goods[GoodType.CAMEL]
+        goods._hash_dirty = True
         return goods
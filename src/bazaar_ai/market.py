@@ -10,6 +10,7 @@ if TYPE_CHECKING:
     from .trader import Trader, TraderAction
 
 import random
+from copy import copy
 from uuid import UUID
 
 
@@ -77,6 +78,34 @@ class Market(State):
         self.camel_bonus = camel_bonus
         self.max_goods_count = max_goods_count
     
+    def clone(self) -> Market:
+        # copy only what the game mutates; the players and the action that led
+        # here are shared, which avoids deep-copying every agent on each turn
+        market = copy(self)
+        market.rng = random.Random()
+        market.rng.setstate(self.rng.getstate())
+        market.players = list(self.players)
+        market.reserved_goods = list(self.reserved_goods)
+        market.coins = self.coins.clone()
+        market.player_goods = {player: goods.clone() for player, goods in self.player_goods.items()}
+        market.player_coins = {player: coins.clone() for player, coins in self.player_coins.items()}
+        market.goods = self.goods.clone()
+        market.sold_goods = list(self.sold_goods)
+        return market
+    
+    def state_key(self) -> tuple:
+        # a hashable snapshot of the position (whose turn it is, every hand,
+        # coin stack and the deck order), e.g. for transposition tables; it is
+        # built from plain values, so later changes to the state leave it intact
+        return (
+            self.actor,
+            tuple(self.player_goods[player]._counts() for player in self.players),
+            tuple(self.player_coins[player]._stacks() for player in self.players),
+            self.goods._counts(),
+            self.coins._stacks(),
+            tuple(self.reserved_goods),
+        )
+
     def refill_market(self):
         while self.goods.count() < self.max_goods_count and self.reserved_goods:
             good_type = self.reserved_goods.pop()
@@ -117,4 +146,43 @@ class MarketObservation(Observation):
         self.actor_non_camel_goods_count = self.actor_goods.count(include_camels=False)
 
         super().__init__(observer_id)
-    
+
+    def clone(self) -> MarketObservation:
+        # goods and coin stacks may be references into the live market, so
+        # those are copied; everything else is shared with the original
+        observation = copy(self)
+        observation.actor_goods = self.actor_goods.clone()
+        observation.actor_goods_coins = {gt: list(c) for gt, c in self.actor_goods_coins.items()}
+        observation.actor_bonus_coins_counts = dict(self.actor_bonus_coins_counts)
+        observation.market_goods = self.market_goods.clone()
+        observation.market_goods_coins = {gt: list(c) for gt, c in self.market_goods_coins.items()}
+        observation.market_bonus_coins_counts = dict(self.market_bonus_coins_counts)
+        return observation
+
+    def _key(self):
+        # the action that led here is deliberately left out: two observations
+        # of the same position compare equal regardless of how it was reached.
+        # coin stacks are keyed by type in a fixed order, so only the integer
+        # values are kept, which keeps hashing off the (Python-level) Enum.__hash__
+        return (
+            self.observer,
+            self.actor,
+            self.actor_goods._counts(),
+            tuple(tuple(coins) for coins in self.actor_goods_coins.values()),
+            tuple(self.actor_bonus_coins_counts.values()),
+            self.market_goods._counts(),
+            tuple(tuple(coins) for coins in self.market_goods_coins.values()),
+            tuple(self.market_bonus_coins_counts.values()),
+            self.market_reserved_goods_count,
+            self.max_player_goods_count,
+            self.max_market_goods_count,
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, MarketObservation):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
@@ -11,8 +11,8 @@ class RandomAgent(Trader):
     
     def select_action(self, actions, observation, simulate_action_fnc):
         """Randomly select an action from available options"""
-        return self.rng.choice(actions)
+        return actions[int(self.rng.random() * len(actions))]
     
-    def calculate_reward(self, old_observation, new_observation, has_acted, environment_reward):
+    def calculate_reward(self, old_observation, new_observation, has_acted, environment_reward=None):
         """No reward calculation needed for random agent"""
         pass
\ No newline at end of file
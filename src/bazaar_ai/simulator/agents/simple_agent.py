@@ -1,4 +1,4 @@
-from bazaar_ai.trader import Trader, TraderAction, SellAction, TakeAction, TradeAction
+from bazaar_ai.trader import Trader, TraderActionType
 from bazaar_ai.goods import GoodType
 
 class SmartAgent(Trader):
@@ -27,51 +27,49 @@ class SmartAgent(Trader):
     def select_action(self, actions, observation, simulate_action_fnc):
         """Select the best action based on strategic evaluation"""
         
-        # Separate actions by type
-        sell_actions = [a for a in actions if isinstance(a, SellAction)]
-        take_actions = [a for a in actions if isinstance(a, TakeAction)]
-        trade_actions = [a for a in actions if isinstance(a, TradeAction)]
-        
-        # Evaluate all actions and pick the best
-        best_action = None
-        best_score = float('-inf')
+        # Evaluators by action type, with a tie-break priority: on equal scores
+        # selling beats taking, which beats trading
+        evaluators = {
+            TraderActionType.SELL: (self._evaluate_sell_action, 2),
+            TraderActionType.TAKE: (self._evaluate_take_action, 1),
+            TraderActionType.TRADE: (self._evaluate_trade_action, 0),
+        }
         
-        # 1. Evaluate selling actions (highest priority if we can get bonus)
-        for action in sell_actions:
-            score = self._evaluate_sell_action(action, observation)
-            if score > best_score:
-                best_score = score
-                best_action = action
+        # Running totals of each market coin stack, taken from the top:
+        # selling n goods of a type earns top_coin_sums[good_type][n]
+        top_coin_sums = {}
+        for good_type, coins in observation.market_goods_coins.items():
+            sums = [0]
+            for coin in reversed(coins):
+                sums.append(sums[-1] + coin)
+            top_coin_sums[good_type] = sums
         
-        # 2. Evaluate taking actions
-        for action in take_actions:
-            score = self._evaluate_take_action(action, observation)
-            if score > best_score:
-                best_score = score
-                best_action = action
+        # Evaluate all actions in a single pass and pick the best
+        best_action = None
+        best_score = (float('-inf'), 0)
         
-        # 3. Evaluate trading actions (lower priority)
-        for action in trade_actions:
-            score = self._evaluate_trade_action(action, observation)
+        for action in actions:
+            evaluate, priority = evaluators[action.trader_action_type]
+            score = (evaluate(action, observation, top_coin_sums), priority)
             if score > best_score:
                 best_score = score
                 best_action = action
         
-        return best_action if best_action else self.rng.choice(actions)
+        return best_action if best_action else actions[int(self.rng.random() * len(actions))]
     
-    def _evaluate_sell_action(self, action, observation):
+    def _evaluate_sell_action(self, action, observation, top_coin_sums):
         """Evaluate the value of a sell action"""
         good_type = action._sell
         count = action._count
         
         # Get the coin values we'd receive
-        available_coins = observation.market_goods_coins.get(good_type, [])
-        if len(available_coins) < count:
+        coin_sums = top_coin_sums.get(good_type, [0])
+        coins_remaining = len(coin_sums) - 1
+        if coins_remaining < count:
             return -1000  # Can't sell if not enough coins
         
         # Calculate immediate coin value
-        coins_to_receive = available_coins[-count:]
-        coin_value = sum(coins_to_receive)
+        coin_value = coin_sums[count]
         
         # Bonus for selling 3+, 4+, or 5+ cards (bonus tokens)
         bonus_multiplier = 1.0
@@ -86,20 +84,20 @@ class SmartAgent(Trader):
         # as their coins deplete fast
         scarcity_bonus = 0
         if good_type in [GoodType.DIAMOND, GoodType.GOLD, GoodType.SILVER]:
-            scarcity_bonus = len(available_coins) * 2  # More valuable when more coins left
+            scarcity_bonus = coins_remaining * 2  # More valuable when more coins left
         
         # Calculate total score
         score = (coin_value * bonus_multiplier) + scarcity_bonus
         
         return score
     
-    def _evaluate_take_action(self, action, observation):
+    def _evaluate_take_action(self, action, observation, top_coin_sums):
         """Evaluate the value of a take action"""
         good_type = action._take
         count = action._count
         
         # Taking camels
-        if good_type == GoodType.CAMEL:
+        if good_type is GoodType.CAMEL:
             # Camels are useful but low priority unless we're close to end
             camel_value = 5 if observation.market_reserved_goods_count < 15 else 2
             return camel_value
@@ -113,8 +111,7 @@ class SmartAgent(Trader):
         good_value = self.good_values.get(good_type, 1)
         
         # Check how many coins are left in market for this good
-        available_coins = observation.market_goods_coins.get(good_type, [])
-        coins_remaining = len(available_coins)
+        coins_remaining = len(top_coin_sums.get(good_type, [0])) - 1
         
         # Higher value if we're close to having enough to sell for bonus
         actor_goods = observation.actor_goods
@@ -134,7 +131,7 @@ class SmartAgent(Trader):
         score = (good_value * 5) + bonus_potential + coin_availability_bonus
         return score
     
-    def _evaluate_trade_action(self, action, observation):
+    def _evaluate_trade_action(self, action, observation, top_coin_sums):
         """Evaluate the value of a trade action"""
         requested = action.requested_goods
         offered = action.offered_goods
@@ -161,7 +158,7 @@ class SmartAgent(Trader):
         set_bonus = 0
         
         for good_type in GoodType:
-            if good_type == GoodType.CAMEL:
+            if good_type is GoodType.CAMEL:
                 continue
             
             new_count = actor_goods[good_type] - offered[good_type] + requested[good_type]
@@ -179,6 +176,6 @@ class SmartAgent(Trader):
         
         return score
     
-    def calculate_reward(self, old_observation, new_observation, has_acted, environment_reward):
+    def calculate_reward(self, old_observation, new_observation, has_acted, environment_reward=None):
         """Calculate reward (not used in this greedy agent, but required by interface)"""
         pass
\ No newline at end of file
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Optional, Callable
 from enum import Enum
+from copy import copy
 
 from arelai.player import Player, Action
 
@@ -28,6 +29,13 @@ class TraderAction(Action):
     def trader_action_type(self):
         return self._trader_action_type
 
+    def clone(self) -> TraderAction:
+        # the actor is shared rather than deep-copied along with its agent state
+        action = copy(self)
+        action.requested_goods = self.requested_goods.clone()
+        action.offered_goods = self.offered_goods.clone()
+        return action
+
 
 class SellAction(TraderAction):
     MIN_SELL_COUNT = {
@@ -55,6 +63,7 @@ class SellAction(TraderAction):
             offered_goods
             )
     
+    @staticmethod
     def all_actions(observation: MarketObservation) -> list['SellAction']:
         actor = observation.actor
         actions = []
@@ -65,7 +74,7 @@ class SellAction(TraderAction):
     
         actor_goods = observation.actor_goods
         for good_type in GoodType:
-            if good_type == GoodType.CAMEL:
+            if good_type is GoodType.CAMEL:
                 continue
             for count in range(SellAction.MIN_SELL_COUNT[good_type], actor_goods[good_type]+1):
                 action = SellAction(actor, good_type, count)
@@ -87,6 +96,7 @@ class TakeAction(TraderAction):
             requested_goods,
             offered_goods)
 
+    @staticmethod
     def all_actions(observation: MarketObservation) -> list['TakeAction']:
         actions = []
         
@@ -104,7 +114,7 @@ class TakeAction(TraderAction):
         # otherwise, the actor cannot take more goods than he/she can hold
         if actor_goods.count(include_camels=False) < observation.max_player_goods_count:
             for good_type in GoodType:
-                if good_type != GoodType.CAMEL:
+                if good_type is not GoodType.CAMEL:
                     if market_goods[good_type] > 0:
                         actions.append(TakeAction(actor, good_type, 1))
         return actions
@@ -130,6 +140,7 @@ class TradeAction(TraderAction):
             requested_goods,
             offered_goods)
 
+    @staticmethod
     def all_actions(observation: MarketObservation) -> list['TradeAction']:
         from itertools import product
 
@@ -141,49 +152,34 @@ class TradeAction(TraderAction):
         if market_goods.count() < 5:
             return []
 
-        max_take = {gt: market_goods[gt] for gt in GoodType if gt != GoodType.CAMEL}
-        max_give = {gt: actor_goods[gt] for gt in GoodType}
+        # Enumerate net changes as plain per-type count tuples (in GoodType
+        # order) and only build TradeAction objects for the legal ones.
+        # Camels can be given but never taken, and the ranges already keep
+        # every count within what the actor and the market hold.
+        max_take = [0 if gt is GoodType.CAMEL else market_goods[gt] for gt in GoodType]
+        max_give = [actor_goods[gt] for gt in GoodType]
+        ranges = [range(-give, take+1) for give, take in zip(max_give, max_take)]
 
-        # Generate all combinations of give/take from -max_give to +max_take
-        ranges = {gt: range(-max_give[gt], max_take.get(gt, 0)+1) for gt in GoodType}
-        all_possible = product(*[ranges[gt] for gt in GoodType])
+        # room left in the actor's hand for non-camel goods
+        capacity = observation.max_player_goods_count - actor_goods.count(include_camels=False)
 
         actions = []
-        for combo in all_possible:
-            action = TradeAction(actor, Goods.from_dict(dict(zip(GoodType, combo))))
-            
-            requested_goods = action.requested_goods
-            offered_goods = action.offered_goods
-
-            # no camels can be taken
-            if requested_goods[GoodType.CAMEL] > 0:
-                continue
-
+        for combo in product(*ranges):
             # the number of goods taken must equal the number of goods given
-            if requested_goods.count() != offered_goods.count():
+            if sum(combo) != 0:
                 continue
 
+            taken_count = sum(map(abs, combo)) // 2
+
             # at least two goods must be taken
-            if requested_goods.count() < 2:
+            if taken_count < 2:
                 continue
-            
+
             # cannot take more than the actor can hold
-            requested_non_camels_count = requested_goods.count(include_camels=False)
-            if actor_goods.count(include_camels=False) + requested_non_camels_count > observation.max_player_goods_count:
-                continue 
-
-            # cannot give more than actor has or take more than market has
-            violates = False
-            if market_goods.count() < 5 and requested_goods.count() >= 1:
-                violates = True
-            for gt in GoodType:
-                if requested_goods[gt] > market_goods[gt]:
-                    violates = True
-                if offered_goods[gt] > actor_goods[gt]:
-                    violates = True
-            if violates:
+            if taken_count > capacity:
                 continue
-            actions.append(action)
+
+            actions.append(TradeAction(actor, Goods.from_dict(dict(zip(GoodType, combo)))))
         return actions
 
 
@@ -196,12 +192,13 @@ class Trader(Player):
     def select_action(self,
                       actions: list[TraderAction],
                       observation: MarketObservation,
-                      simulate_action_fnc: Callable[[TraderAction], MarketObservation]):
-        return self.rng.choice(actions)
+                      simulate_action_fnc: Callable[[TraderAction], MarketObservation]) -> TraderAction:
+        # indexing with a single random() draw skips rng.choice's _randbelow loop
+        return actions[int(self.rng.random() * len(actions))]
     
     def calculate_reward(self,
                          old_observation: MarketObservation,
                          new_observation: MarketObservation,
                          has_acted: bool,
-                         environment_reward: Optional[float]):
+                         environment_reward: Optional[float] = None):
         pass
\ No newline at end of file
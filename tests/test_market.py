@@ -0,0 +1,27 @@
+from bazaar_ai import BasicBazaar, Trader, GoodType
+
+
+def make_game(seed=0):
+    return BasicBazaar(seed, [Trader(seed, "A"), Trader(seed + 1, "B")])
+
+
+def test_clones_share_state_key():
+    state = make_game().state
+    assert state.clone().state_key() == state.state_key()
+    assert hash(state.clone().state_key()) == hash(state.state_key())
+
+
+def test_applying_an_action_changes_state_key():
+    game = make_game()
+    state = game.state
+    action = game.all_actions(state.actor, state)[0]
+    assert game.apply_action(state, action).state_key() != state.state_key()
+
+
+def test_state_key_is_a_snapshot():
+    state = make_game().state
+    table = {state.state_key(): 1}
+    key = state.state_key()
+    state.goods.add(GoodType.GOLD)
+    assert table[key] == 1
+    assert state.state_key() not in table